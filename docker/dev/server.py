@@ -1,43 +1,141 @@
-import json
 import os
+import socket
 import ssl
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import urlparse
+import sys
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVER_VERSION = "LokanMockScene/0.1"
+
+
+def canned_response(status: str, body: bytes) -> tuple[bytes, bytes]:
+    """Encode a complete response, split around the value of its Date header."""
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        f"Server: {SERVER_VERSION} {BaseHTTPRequestHandler.sys_version}\r\n"
+        "Date: "
+    ).encode("latin-1")
+    tail = (
+        "\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    ).encode("latin-1")
+    return head, tail + body
+
+
+# Both endpoints answer with fixed payloads, so encode them once up front.
+HEALTH_RESPONSE = canned_response("200 OK", b'{"status": "ok"}')
+APPLY_RESPONSE = canned_response("202 Accepted", b'{"status": "accepted"}')
+
+_date_cache = (0, b"")
+
+
+def http_date() -> bytes:
+    """Return the current Date header value, formatted at most once a second."""
+    global _date_cache
+    now = int(time.time())
+    second, value = _date_cache
+    if second != now:
+        value = formatdate(now, usegmt=True).encode("ascii")
+        _date_cache = (now, value)
+    return value
+
+
+# Request bodies are ignored. They are drained through this one buffer instead
+# of being read into a new bytes object; its contents are never looked at, so
+# handler threads can share it.
+_DRAIN_BUFFER = memoryview(bytearray(64 * 1024))
 
 
 class SceneServiceHandler(BaseHTTPRequestHandler):
-    server_version = "LokanMockScene/0.1"
+    server_version = SERVER_VERSION
+    # Keep connections open between requests so clients only pay for the TLS
+    # handshake once; every response carries a Content-Length to frame it.
+    protocol_version = "HTTP/1.1"
+    # Release the worker thread once a kept-alive connection goes idle.
+    timeout = 5
+    # Size the read buffer to one full TLS record so a record is consumed in
+    # a single recv_into() rather than split across two.
+    rbufsize = 16 * 1024
 
     def log_message(self, format, *args):  # noqa: A003 - matching BaseHTTPRequestHandler signature
         # Reduce noise in CI runs.
         return
 
-    def do_GET(self):  # noqa: N802 - inherited API
-        parsed = urlparse(self.path)
-        if parsed.path == "/scene-svc/health":
-            body = json.dumps({"status": "ok"}).encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
-        else:
+    def setup(self):
+        super().setup()
+        # The handshake was deferred by the server; finish it here, on this
+        # connection's own thread and under its timeout.
+        self.connection.do_handshake()
+
+    def send_canned(self, response: tuple[bytes, bytes]) -> None:
+        # Emit status line, headers and body in a single write so the reply
+        # goes out as one send() and one TLS record.
+        head, tail = response
+        self.wfile.write(head + http_date() + tail)
+
+    def discard_body(self, length: int) -> None:
+        remaining = length
+        while remaining:
+            read = self.rfile.readinto(_DRAIN_BUFFER[: min(remaining, len(_DRAIN_BUFFER))])
+            if not read:
+                break
+            remaining -= read
+
+    def serve_health(self) -> None:
+        self.send_canned(HEALTH_RESPONSE)
+
+    def serve_apply(self) -> None:
+        length = int(self.headers.get("Content-Length", "0"))
+        if length:
+            self.discard_body(length)
+        self.send_canned(APPLY_RESPONSE)
+
+    GET_ROUTES = {"/scene-svc/health": serve_health}
+    POST_ROUTES = {"/scene-svc/scenes/apply": serve_apply}
+
+    def dispatch(self, routes) -> None:
+        route = routes.get(self.path.partition("?")[0])
+        if route is None:
             self.send_error(404, "Not Found")
+        else:
+            route(self)
+
+    def do_GET(self):  # noqa: N802 - inherited API
+        self.dispatch(self.GET_ROUTES)
 
     def do_POST(self):  # noqa: N802 - inherited API
-        parsed = urlparse(self.path)
-        if parsed.path == "/scene-svc/scenes/apply":
-            length = int(self.headers.get("Content-Length", "0"))
-            if length:
-                _ = self.rfile.read(length)
-            body = json.dumps({"status": "accepted"}).encode("utf-8")
-            self.send_response(202)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
-        else:
-            self.send_error(404, "Not Found")
+        self.dispatch(self.POST_ROUTES)
+
+
+class SceneServiceServer(ThreadingHTTPServer):
+    # Let several server processes share the port for kernel load balancing.
+    allow_reuse_port = True
+
+    def __init__(self, server_address, handler_class, context: ssl.SSLContext):
+        self.context = context
+        super().__init__(server_address, handler_class)
+
+    def get_request(self):
+        # Wrap each accepted connection with the one shared context so its
+        # session cache and ticket keys let returning clients resume. The
+        # handshake is left to the handler thread so a slow or stalled client
+        # cannot hold up the accept loop, and handshakes run concurrently.
+        sock, addr = self.socket.accept()
+        # Replies are small and written in one go; don't let Nagle hold them.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = self.context.wrap_socket(
+            sock, server_side=True, do_handshake_on_connect=False
+        )
+        return conn, addr
+
+    def handle_error(self, request, client_address):
+        # Failed handshakes and dropped connections are routine; they were
+        # silently discarded when the handshake ran inside accept().
+        if isinstance(sys.exc_info()[1], OSError):
+            return
+        super().handle_error(request, client_address)
 
 
 def require_env(name: str) -> str:
@@ -62,9 +160,11 @@ def run() -> None:
     context.load_cert_chain(certfile=server_cert, keyfile=server_key)
     context.load_verify_locations(cafile=ca_cert)
     context.verify_mode = ssl.CERT_REQUIRED
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    # Only affects TLS 1.2; TLS 1.3 suites are already AEAD-only.
+    context.set_ciphers("ECDHE+AESGCM:!aNULL")
 
-    httpd = HTTPServer((host, port), SceneServiceHandler)
-    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    httpd = SceneServiceServer((host, port), SceneServiceHandler, context)
 
     print(f"Mock scene service listening on https://{bind}")
     httpd.serve_forever()